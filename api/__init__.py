@@ -18,11 +18,14 @@ hoc scripts.
 
 import os
 
-from dotenv import load_dotenv
-
-# Local CLI keeps keys in .env; Railway/cloud inject real env vars. load_dotenv
-# never overrides variables that are already set, so this is safe everywhere.
-load_dotenv()
+# Local CLI keeps keys in .env; Railway injects real env vars and ships no .env,
+# so this package-level load is skipped there. Several api.* modules still call
+# load_dotenv(find_dotenv(...)) themselves at import. load_dotenv never
+# overrides variables that are already set, so loading locally stays safe.
+if not os.environ.get("RAILWAY_ENVIRONMENT_NAME"):
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 _sernia_anthropic_key = os.environ.get("SERNIA_ANTHROPIC_API_KEY")
 if _sernia_anthropic_key:
@@ -85,28 +85,37 @@ from api.src.user.routes import router as user_router
 # from api.src.another_feature.schema import Query as AnotherQuery, Mutation as AnotherMutation
 
 
-# Verify critical environment variables
-required_env_vars = {
-    "SESSION_SECRET_KEY": (
-        "Required for secure session handling. Generate unique values for each environmen!:\n"
-    ),
-    "GOOGLE_OAUTH_CLIENT_ID": ("Required for Google OAuth. Set up in Google Cloud Console.\n"),
-    "GOOGLE_OAUTH_CLIENT_SECRET": ("Required for Google OAuth. Set up in Google Cloud Console.\n"),
-    "GOOGLE_OAUTH_REDIRECT_URI": (
-        "Required for Google OAuth. Must match the URIs configured in Google Cloud Console.\n"
-    ),
-    "OPEN_PHONE_WEBHOOK_SECRET": (
-        "Required for OpenPhone webhook. Set up in OpenPhone dashboard.\n"
-    ),
-}
-
-missing_vars = []
-for var, description in required_env_vars.items():
-    if not os.getenv(var):
-        missing_vars.append(f"- {var}:\n{description}\n")
+# Verify critical environment variables. The per-variable help text is only
+# needed to build the error message, so it's only built on the failure path.
+REQUIRED_ENV_VARS = (
+    "SESSION_SECRET_KEY",
+    "GOOGLE_OAUTH_CLIENT_ID",
+    "GOOGLE_OAUTH_CLIENT_SECRET",
+    "GOOGLE_OAUTH_REDIRECT_URI",
+    "OPEN_PHONE_WEBHOOK_SECRET",
+)
 
+missing_vars = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
 if missing_vars:
-    raise ValueError("Missing required environment variables:\n\n" + "\n".join(missing_vars))
+    env_var_help = {
+        "SESSION_SECRET_KEY": (
+            "Required for secure session handling. Generate unique values for each environmen!:\n"
+        ),
+        "GOOGLE_OAUTH_CLIENT_ID": ("Required for Google OAuth. Set up in Google Cloud Console.\n"),
+        "GOOGLE_OAUTH_CLIENT_SECRET": (
+            "Required for Google OAuth. Set up in Google Cloud Console.\n"
+        ),
+        "GOOGLE_OAUTH_REDIRECT_URI": (
+            "Required for Google OAuth. Must match the URIs configured in Google Cloud Console.\n"
+        ),
+        "OPEN_PHONE_WEBHOOK_SECRET": (
+            "Required for OpenPhone webhook. Set up in OpenPhone dashboard.\n"
+        ),
+    }
+    raise ValueError(
+        "Missing required environment variables:\n\n"
+        + "\n".join(f"- {var}:\n{env_var_help[var]}\n" for var in missing_vars)
+    )
 
 # --- Lifespan Event Handler ---
 
@@ -167,7 +176,7 @@ async def _apscheduler_startup_async() -> None:
 
         logfire.info("APScheduler background startup completed successfully.")
     except Exception as e:
-        logfire.exception(f"APScheduler background startup failed: {e}")
+        logfire.exception("APScheduler background startup failed: {error}", error=str(e))
 
 
 @asynccontextmanager
@@ -175,24 +184,31 @@ async def lifespan(app: FastAPI):
     # Startup logic
     with logfire.span("LIFESPAN: FastAPI index.py"):
         try:
-            await initialize_workspace(WORKSPACE_PATH)
-            # Skills are auto-reloaded by SkillsCapability (auto_reload=True)
-            # before every agent run, so no explicit post-sync reload is needed.
+            # The workspace git sync and the DB test don't depend on each other,
+            # so cold start waits for the slower of the two rather than their sum.
+            # If one step fails, TaskGroup cancels the other's coroutine, but that
+            # doesn't stop work already handed off: a DB check running in a thread
+            # finishes on its own, and a git child process keeps running. Startup
+            # aborts either way, so the process exits shortly after.
+            async with asyncio.TaskGroup() as startup_steps:
+                # Skills are auto-reloaded by SkillsCapability (auto_reload=True)
+                # before every agent run, so no explicit post-sync reload is needed.
+                startup_steps.create_task(initialize_workspace(WORKSPACE_PATH))
+
+                # Skip DB connection test in local dev to speed up hot reloads.
+                # Each test opens a fresh TCP+TLS connection to Neon (~1-2s each, run
+                # sequentially for sync + async engines = ~3-5s blocked startup).
+                # On Railway the test still runs so a bad deploy fails the health check.
+                if is_hosted:
+                    startup_steps.create_task(check_database_connections())
+                else:
+                    logfire.info("Skipping DB connection test (local dev)")
 
             # Clean up stale DuckDB/CSV data from previous conversations
             from api.src.sernia_ai.tools.duckdb_tools import cleanup_stale_data
 
             cleanup_stale_data(max_age_hours=24)
 
-            # Skip DB connection test in local dev to speed up hot reloads.
-            # Each test opens a fresh TCP+TLS connection to Neon (~1-2s each, run
-            # sequentially for sync + async engines = ~3-5s blocked startup).
-            # On Railway the test still runs so a bad deploy fails the health check.
-            if is_hosted:
-                await check_database_connections()
-            else:
-                logfire.info("Skipping DB connection test (local dev)")
-
             # Start APScheduler in the background so FastAPI can begin serving immediately.
             app.state.apscheduler_startup_task = asyncio.create_task(_apscheduler_startup_async())
 
@@ -209,7 +225,11 @@ async def lifespan(app: FastAPI):
 
             logfire.info("LIFESPAN: FastAPI index.py startup completed successfully.")
         except Exception as e:
-            logfire.exception(f"Error during startup: {e}")
+            # Name the failing step's own error, not the TaskGroup's wrapper message.
+            errors = e.exceptions if isinstance(e, ExceptionGroup) else (e,)
+            logfire.exception(
+                "Error during startup: {error}", error="; ".join(str(err) for err in errors)
+            )
             raise
 
     yield  # Application runs here
@@ -234,7 +254,7 @@ async def lifespan(app: FastAPI):
         if scheduler.running:
             scheduler.shutdown(wait=False)  # Don't wait for jobs to complete
     except Exception as e:
-        logfire.warn(f"APScheduler shutdown error: {e}")
+        logfire.warn("APScheduler shutdown error: {error}", error=str(e))
 
     # DBOS DISABLED: Shutdown code preserved for re-enabling.
     # # Shutdown DBOS in a thread with a hard timeout to avoid blocking hot reload.
@@ -268,8 +288,11 @@ logfire.instrument_fastapi(app)
 
 # --- Middleware Registration ---
 
-is_hosted = len(os.getenv("RAILWAY_ENVIRONMENT_NAME", "")) > 0
+is_hosted = bool(os.environ.get("RAILWAY_ENVIRONMENT_NAME"))
 
+# Registration order matters: Starlette wraps in reverse, so the LAST middleware
+# added is the OUTERMOST. CORS is added last so it answers OPTIONS preflights
+# itself, before SessionMiddleware decodes/signs the session cookie.
 # Add session middleware - MUST be added before CORS middleware
 app.add_middleware(
     SessionMiddleware,
@@ -280,7 +303,7 @@ app.add_middleware(
     https_only=is_hosted,
 )
 
-# Add CORS middleware
+# Add CORS middleware (outermost — keep this the last add_middleware call)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -292,13 +315,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browsers cache preflight results for 2h (Chromium's cap) instead of
+    # Starlette's 10-minute default, so most cross-origin calls skip the OPTIONS.
+    max_age=7200,
 )
 
 # --- GraphQL Setup ---
 
-# Merge GraphQL types
-Query = merge_types("Query", (ExamplesQuery,))
-Mutation = merge_types("Mutation", (ExamplesMutation,))
+# Merge GraphQL types. merge_types() synthesizes a new class and walks every
+# field, so only pay for it once there is more than one source type.
+query_types = (ExamplesQuery,)
+mutation_types = (ExamplesMutation,)
+Query = merge_types("Query", query_types) if len(query_types) > 1 else query_types[0]
+Mutation = merge_types("Mutation", mutation_types) if len(mutation_types) > 1 else mutation_types[0]
 
 # Create combined schema for GraphQL
 schema = strawberry.Schema(query=Query, mutation=Mutation)
@@ -324,14 +353,18 @@ app.include_router(schedulers_router, prefix="/api")
 # app.include_router(clickup_router, prefix="/api")
 
 
+# Return types are declared so FastAPI serializes straight to JSON bytes via
+# pydantic-core (its dump_json fast path) instead of jsonable_encoder + json.dumps.
+# Don't set default_response_class=ORJSONResponse — a custom response class
+# disables that fast path, and ORJSONResponse is deprecated.
 @app.get("/api/hello")
-async def hello_fast_api():
+async def hello_fast_api() -> dict[str, str]:
     logfire.info("Hello from FastAPI")
     return {"message": "Hello from FastAPI"}
 
 
 @app.get("/api/health")
-async def health_check():
+async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
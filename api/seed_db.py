@@ -86,48 +86,85 @@ def get_contact_seeds() -> list[ContactSeed]:
 async def seed_contacts(dry_run: bool = False) -> None:
     """Seed contacts into the database."""
     # Import here to avoid circular imports and ensure env is loaded
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
     from sqlalchemy.future import select
 
     from api.src.contact.models import Contact
-    from api.src.contact.service import ContactCreate, create_contact
+    from api.src.contact.service import ContactCreate
     from api.src.database.database import AsyncSessionFactory
+    from api.src.user.models import User
 
     seeds = get_contact_seeds()
 
     async with AsyncSessionFactory() as session:
-        for seed in seeds:
-            # Check if contact already exists by slug
-            query = select(Contact).where(Contact.slug == seed.slug)
-            result = await session.execute(query)
-            existing = result.scalars().first()
+        # One IN query for every seed slug instead of a SELECT per seed
+        result = await session.execute(
+            select(Contact.slug, Contact.id).where(Contact.slug.in_([s.slug for s in seeds]))
+        )
+        existing_ids = dict(result.all())
 
-            if existing:
-                log_info(f"✓ Contact '{seed.slug}' already exists (id: {existing.id})")
-                continue
+        missing = []
+        for seed in seeds:
+            if seed.slug in existing_ids:
+                log_info(f"✓ Contact '{seed.slug}' already exists (id: {existing_ids[seed.slug]})")
+            else:
+                missing.append(seed)
 
-            if dry_run:
+        if dry_run:
+            for seed in missing:
                 log_info(
                     f"[DRY RUN] Would create contact '{seed.slug}': "
                     f"{seed.first_name} {seed.last_name}, "
                     f"email={seed.email}, phone={seed.phone_number}"
                 )
-                continue
+            return
+        if not missing:
+            return
 
-            # Create the contact
-            try:
-                contact_data = ContactCreate(
+        # Insert the missing seeds in one INSERT ... ON CONFLICT (slug) DO NOTHING,
+        # which also covers a contact created between the check and the insert.
+        # Rows are built directly rather than through create_contact (which
+        # commits per row); ContactCreate still validates/normalizes each seed,
+        # and users are linked by email in one query like create_contact does.
+        try:
+            contact_rows = [
+                ContactCreate(
                     slug=seed.slug,
                     first_name=seed.first_name,
                     last_name=seed.last_name,
                     email=seed.email,
                     phone_number=seed.phone_number,
                     notes=seed.notes,
+                ).model_dump()
+                for seed in missing
+            ]
+            emails = [row["email"] for row in contact_rows if row["email"]]
+            user_ids_by_email = {}
+            if emails:
+                users = await session.execute(
+                    select(User.email, User.id).where(User.email.in_(emails))
                 )
-                created = await create_contact(session, contact_data)
-                log_info(f"✓ Created contact '{seed.slug}' (id: {created.id})")
-            except Exception as e:
-                log_error(f"✗ Failed to create contact '{seed.slug}': {e}")
-                raise
+                user_ids_by_email = dict(users.all())
+            for row in contact_rows:
+                row["user_id"] = user_ids_by_email.get(row["email"])
+
+            stmt = (
+                pg_insert(Contact)
+                .values(contact_rows)
+                .on_conflict_do_nothing(index_elements=["slug"])
+                .returning(Contact.slug, Contact.id)
+            )
+            created_ids = dict((await session.execute(stmt)).all())
+            await session.commit()
+        except Exception as e:
+            log_error(f"✗ Failed to create contacts {[seed.slug for seed in missing]}: {e}")
+            raise
+
+        for row in contact_rows:
+            if row["slug"] in created_ids:
+                log_info(f"✓ Created contact '{row['slug']}' (id: {created_ids[row['slug']]})")
+            else:
+                log_info(f"✓ Contact '{row['slug']}' already exists")
 
 
 async def seed_app_settings(dry_run: bool = False) -> None:
@@ -142,7 +179,7 @@ async def seed_app_settings(dry_run: bool = False) -> None:
 
     async with AsyncSessionFactory() as session:
         existing = (
-            await session.execute(select(AppSetting).where(AppSetting.key == "model_config"))
+            await session.execute(select(AppSetting.key).where(AppSetting.key == "model_config"))
         ).scalar_one_or_none()
         if existing:
             log_info("✓ app_setting 'model_config' already exists")
@@ -332,15 +369,14 @@ async def seed_sample_conversations(dry_run: bool = False) -> None:
     samples = _build_sample_conversations()
 
     async with AsyncSessionFactory() as session:
+        result = await session.execute(
+            select(AgentConversation.id).where(
+                AgentConversation.id.in_([sample["conversation_id"] for sample in samples])
+            )
+        )
+        existing_ids = set(result.scalars().all())
         for sample in samples:
-            existing = (
-                await session.execute(
-                    select(AgentConversation.id).where(
-                        AgentConversation.id == sample["conversation_id"]
-                    )
-                )
-            ).scalar_one_or_none()
-            if existing:
+            if sample["conversation_id"] in existing_ids:
                 log_info(f"✓ Conversation '{sample['conversation_id']}' already exists")
                 continue
             if dry_run:
@@ -407,13 +443,16 @@ async def seed_fixture_conversations(dry_run: bool = False) -> None:
 
     rows = json.loads(fixture_file.read_text())
     async with AsyncSessionFactory() as session:
+        # One IN query for all fixture ids rather than a SELECT per row
+        result = await session.execute(
+            select(AgentConversation.id).where(
+                AgentConversation.id.in_([row["id"] for row in rows])
+            )
+        )
+        existing_ids = set(result.scalars().all())
+        created_ids = []
         for row in rows:
-            existing = (
-                await session.execute(
-                    select(AgentConversation.id).where(AgentConversation.id == row["id"])
-                )
-            ).scalar_one_or_none()
-            if existing:
+            if row["id"] in existing_ids:
                 log_info(f"✓ Fixture conversation '{row['id']}' already exists")
                 continue
             if dry_run:
@@ -430,8 +469,13 @@ async def seed_fixture_conversations(dry_run: bool = False) -> None:
                     contact_identifier=row.get("contact_identifier"),
                 )
             )
+            created_ids.append(row["id"])
+
+        # One transaction for the whole fixture instead of a commit per row
+        if created_ids:
             await session.commit()
-            log_info(f"✓ Created fixture conversation '{row['id']}'")
+        for conversation_id in created_ids:
+            log_info(f"✓ Created fixture conversation '{conversation_id}'")
 
 
 async def main(dry_run: bool = False) -> None:
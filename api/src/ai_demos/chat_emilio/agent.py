@@ -5,15 +5,14 @@ This agent can answer questions about the developer's portfolio, skills, and pro
 Each information source has its own tool that fetches from a specific URL.
 """
 
+import time
 from dataclasses import dataclass
 
 import httpx
 import logfire
-from dotenv import load_dotenv
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.capabilities import Instrumentation
-
-load_dotenv(".env")
+from pydantic_ai.models.anthropic import AnthropicModelSettings
 
 
 @dataclass
@@ -27,27 +26,62 @@ SYSTEM_INSTRUCTIONS = """You are a helpful assistant that can answer questions a
 
 You have tools that fetch information about Emilio from specific sources. Use them to answer questions.
 
-ALWAYS use the fetch_resume tool first if you haven't already — it has the most comprehensive info.
-Use other fetch tools as needed for additional context.
+His resume, which has the most comprehensive info, is included below when available.
+Use the other fetch tools as needed for additional context.
 
 There is no need to call the same tool more than once per conversation since the content is static.
 """
 
 agent = Agent(
     "anthropic:claude-haiku-4-5-20251001",
-    system_prompt=SYSTEM_INSTRUCTIONS,
+    instructions=SYSTEM_INSTRUCTIONS,
+    # The instructions (including the inlined resume) and tool definitions are
+    # identical on every run, so let Anthropic cache that prefix.
+    model_settings=AnthropicModelSettings(
+        anthropic_cache_instructions=True,
+        anthropic_cache_tool_definitions=True,
+        anthropic_cache_messages=True,
+    ),
     retries=3,
     capabilities=[Instrumentation()],
     name="chat_emilio",
 )
 
 
+# The fetched pages are static, so keep each one for an hour rather than
+# re-downloading it for every conversation that calls the tool.
+_page_cache: dict[str, dict] = {}
+_PAGE_CACHE_TTL = 3600  # 1 hour
+
+
 async def _fetch_url(url: str) -> str:
     """Fetch a URL and return its text content."""
+    entry = _page_cache.get(url)
+    if entry and (time.time() - entry["ts"]) < _PAGE_CACHE_TTL:
+        return entry["text"]
+
     async with httpx.AsyncClient(follow_redirects=True, timeout=15) as client:
         response = await client.get(url)
         response.raise_for_status()
-        return response.text
+    _page_cache[url] = {"text": response.text, "ts": time.time()}
+    return response.text
+
+
+RESUME_URL = "https://resume.eesposito.com/"
+
+
+@agent.instructions
+async def resume_instructions() -> str:
+    """Inline the resume so the model doesn't spend a tool round-trip fetching it.
+    Instructions are sent on every request (unlike system prompts, which are dropped
+    once there is message history), and are served from the page cache after the first run.
+    """
+    try:
+        resume = await _fetch_url(RESUME_URL)
+    except httpx.HTTPError:
+        logfire.exception("Failed to prefetch resume for chat_emilio instructions")
+        return "The resume could not be preloaded; call fetch_resume before answering."
+    return f"Emilio's resume (already fetched, no need to call fetch_resume):\n\n{resume}"
 
 
 @agent.tool_plain
@@ -55,7 +89,7 @@ async def fetch_resume() -> str:
     """Fetch Emilio's resume. Contains his full work experience, education, skills, and career summary.
     This is the best starting point for answering questions about Emilio.
     """
-    return await _fetch_url("https://resume.eesposito.com/")
+    return await _fetch_url(RESUME_URL)
 
 
 @agent.tool_plain
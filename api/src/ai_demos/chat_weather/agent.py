@@ -4,10 +4,11 @@ Chat Agent using PydanticAI with weather tool
 This agent provides a general-purpose chat assistant with weather functionality.
 """
 
+import time
 from dataclasses import dataclass
 
+import httpx
 import logfire
-import requests
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.openai import OpenAIChatModel
 
@@ -33,6 +34,12 @@ agent = Agent(
     name="chat_weather",
 )
 
+# Forecasts don't change within a few minutes, and nearby points (same
+# 2-decimal grid cell, ~1 km) get the same answer, so cache per rounded point.
+_weather_cache: dict[tuple[float, float], dict] = {}
+_WEATHER_CACHE_TTL = 300  # 5 minutes
+_WEATHER_CACHE_MAX_ENTRIES = 256
+
 
 @agent.tool
 async def get_current_weather(
@@ -49,14 +56,24 @@ async def get_current_weather(
     Returns:
         Weather data including current temperature, hourly forecast, and daily sunrise/sunset times
     """
+    latitude, longitude = round(latitude, 2), round(longitude, 2)
+    entry = _weather_cache.get((latitude, longitude))
+    if entry and (time.time() - entry["ts"]) < _WEATHER_CACHE_TTL:
+        return entry["data"]
+
     url = f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current=temperature_2m&hourly=temperature_2m&daily=sunrise,sunset&timezone=auto"
 
     try:
-        response = requests.get(url)
-        response.raise_for_status()
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(url)
+            response.raise_for_status()
         weather_data = response.json()
         logfire.info(f"Weather fetched for lat={latitude}, lon={longitude}")
-        return weather_data
-    except requests.RequestException as e:
+    except (httpx.HTTPError, ValueError) as e:  # ValueError: non-JSON body
         logfire.error(f"Error fetching weather data: {e}")
         return {"error": f"Failed to fetch weather data: {str(e)}"}
+
+    if len(_weather_cache) >= _WEATHER_CACHE_MAX_ENTRIES:
+        _weather_cache.clear()
+    _weather_cache[(latitude, longitude)] = {"data": weather_data, "ts": time.time()}
+    return weather_data
@@ -5,14 +5,12 @@ This agent determines which specialized agent should handle a user's message.
 It uses structured output to return either "emilio" or "weather".
 """
 
-from dotenv import load_dotenv
+from enum import StrEnum
+
 from pydantic import BaseModel
 from pydantic_ai import Agent
 from pydantic_ai.models.openai import OpenAIChatModel
 
-load_dotenv(".env")
-from enum import StrEnum
-
 # @dataclass
 # class RouterContext:
 #     """Context for the router agent"""
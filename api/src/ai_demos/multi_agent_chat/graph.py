@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Literal
 
 import logfire
-from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict
 from pydantic_ai.ui.vercel_ai import VercelAIAdapter
 from pydantic_graph.graph_builder import GraphBuilder
@@ -20,8 +19,6 @@ from api.src.ai_demos.chat_weather.agent import ChatContext as WeatherContext
 from api.src.ai_demos.chat_weather.agent import agent as weather_agent
 from api.src.ai_demos.multi_agent_chat.decision_agent import AgentName, router_agent
 
-load_dotenv(".env")
-
 
 @dataclass
 class MultiAgentState:
@@ -111,9 +111,9 @@ async def create_contact(db: AsyncSession, contact_create: ContactCreate) -> Con
     # Validate user_id if it's set (either provided or found by email)
     if final_user_id:
         logfire.debug(f"Validating user ID {final_user_id} for new contact.")
-        user_exists_query = select(User).where(User.id == final_user_id)
+        user_exists_query = select(User.id).where(User.id == final_user_id)
         user_result = await db.execute(user_exists_query)
-        if not user_result.scalars().first():
+        if user_result.scalar_one_or_none() is None:
             logfire.warn(f"User with ID '{final_user_id}' not found during contact creation.")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
@@ -300,7 +301,9 @@ async def check_async_engine_select_one():
 @logfire.instrument("test-database-connections")
 async def check_database_connections():
     try:
-        check_sync_engine_select_one()
+        # The sync check blocks, so run it in a thread to keep the event loop
+        # free for the other startup work (workspace git sync).
+        await asyncio.to_thread(check_sync_engine_select_one)
         await check_async_engine_select_one()
     except Exception as e:
         logfire.exception(f"Error during database connection test: {e}")
@@ -8,6 +8,7 @@ load_dotenv(find_dotenv(".env"))
 import base64
 import json
 import os
+from functools import cache
 
 from fastapi import HTTPException
 from google.oauth2 import service_account
@@ -100,6 +101,15 @@ def get_service_credentials(scopes: list[str] | None = None) -> service_account.
         )
 
 
+@cache
+def _cached_delegated_credentials(
+    user_email: str, scopes: tuple[str, ...] | None
+) -> service_account.Credentials:
+    """One credentials object per (user, scopes), so its access token is reused until
+    it expires instead of a fresh JWT sign + token exchange on every Google call."""
+    return get_service_credentials(list(scopes) if scopes else None).with_subject(user_email)
+
+
 def get_delegated_credentials(
     user_email: str, scopes: list[str] | None = None
 ) -> service_account.Credentials:
@@ -115,9 +125,7 @@ def get_delegated_credentials(
         Delegated service account credentials that can be used with any Google API.
     """
     try:
-        credentials = get_service_credentials(scopes)
-        delegated_credentials = credentials.with_subject(user_email)
-        return delegated_credentials
+        return _cached_delegated_credentials(user_email, tuple(scopes) if scopes else None)
 
     except Exception as e:
         raise HTTPException(
@@ -34,7 +34,6 @@ async def handle_gmail_notifications(
     try:
         # Log request details
         logfire.info("=== New Gmail Notification ===")
-        logfire.info(f"Headers: {dict(request.headers)}")
 
         # Verify the request is from Google Pub/Sub
         logfire.info("Verifying Pub/Sub token...")
@@ -103,7 +102,12 @@ async def handle_gmail_notifications(
             )
 
     except Exception as e:
-        logfire.exception("Unhandled error in Gmail notification handler")
+        # Headers are only copied out when something went wrong, and never with the
+        # Pub/Sub bearer token in them.
+        logfire.exception(
+            "Unhandled error in Gmail notification handler",
+            headers={k: v for k, v in request.headers.items() if k != "authorization"},
+        )
         return Response(
             status_code=500,
             content=f"Failed to process Gmail notification (unhandled error2): {str(e)}",
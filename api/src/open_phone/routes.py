@@ -2,14 +2,21 @@ import base64
 import hmac
 import os
 import re
-import time
 from datetime import date, datetime
-from pprint import pprint
+from functools import cache
 
 import httpx as _httpx
 import logfire
-import requests
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Security
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    Security,
+)
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
 from sqlalchemy import select
@@ -21,8 +28,11 @@ from api.src.open_phone.escalate import analyze_for_twilio_escalation
 from api.src.open_phone.models import OpenPhoneEvent
 from api.src.open_phone.schema import OpenPhoneWebhookPayload
 from api.src.open_phone.service import (
-    get_contacts_by_external_ids,
+    _openphone_client,
+    get_contacts_by_external_ids_response,
+    get_contacts_grouped_by_external_id,
     get_contacts_sheet_as_json,
+    get_custom_field_key_to_name,
     send_message,
 )
 from api.src.sernia_ai.config import QUO_SERNIA_AI_PHONE_ID
@@ -93,32 +103,49 @@ async def contains_emoji(text):
     return bool(emoji_pattern.search(text))
 
 
+# openphone-signature header: "hmac;<version>;<timestamp ms>;<base64 digest>".
+# A SHA-256 digest is 32 bytes, i.e. exactly 44 base64 characters ending in one
+# "=", so a digest of any other shape is rejected by the match alone.
+_SIGNATURE_HEADER_RE = re.compile(r"hmac;1;(\d+);([A-Za-z0-9+/]{43}=)")
+
+
+@cache
+def _decode_signing_key(signing_key: str) -> bytes:
+    """Base64-decode the webhook secret once per distinct value, not per webhook."""
+    return base64.b64decode(signing_key)
+
+
 async def verify_open_phone_signature(request: Request):
     # signing_key = os.getenv(env_var_name)
     signing_key = os.getenv("OPEN_PHONE_WEBHOOK_SECRET")
     if not signing_key:
         raise HTTPException(403, "OPEN_PHONE_WEBHOOK_SECRET not configured")
     data = await request.body()
-    # Parse the fields from the openphone-signature header.
-    signature = request.headers["openphone-signature"]
-    fields = signature.split(";")
-    timestamp = fields[2]
-    provided_digest = fields[3]
+    # Parse the fields from the openphone-signature header. One fullmatch pulls
+    # out the two fields we need and rejects a missing or malformed header with
+    # a 403 up front, rather than an IndexError/KeyError surfacing as a 500.
+    # The pattern also pins the digest to the length of a SHA-256 digest, so
+    # junk signatures are turned away before any HMAC work is done.
+    match = _SIGNATURE_HEADER_RE.fullmatch(request.headers.get("openphone-signature", ""))
+    if match is None:
+        logfire.error("signature verification failed: malformed openphone-signature header")
+        raise HTTPException(403, "Signature verification failed")
+    timestamp, provided_digest = match.groups()
 
-    # Compute the data covered by the signature as bytes.
-    signed_data_bytes = b"".join([timestamp.encode(), b".", data])
+    # Compute the data covered by the signature as bytes, joining without a list.
+    signed_data_bytes = b"".join((timestamp.encode(), b".", data))
 
     # Convert the base64-encoded signing key to bytes.
-    signing_key_bytes = base64.b64decode(signing_key)
+    signing_key_bytes = _decode_signing_key(signing_key)
 
-    # Compute the SHA256 HMAC digest.
-    # Obtain the digest in base64-encoded form for easy comparison with
-    # the digest provided in the openphone-signature header.
-    hmac_object = hmac.new(signing_key_bytes, signed_data_bytes, "sha256")
-    computed_digest = base64.b64encode(hmac_object.digest()).decode()
+    # Compute the SHA256 HMAC digest with the one-shot C path (no HMAC object),
+    # and compare raw digest bytes rather than base64-encoding ours to match
+    # the header's form (the regex above guarantees the header's is valid base64).
+    computed_digest = hmac.digest(signing_key_bytes, signed_data_bytes, "sha256")
+    provided_digest_bytes = base64.b64decode(provided_digest)
 
     # Make sure the computed digest matches the digest in the openphone header.
-    if hmac.compare_digest(provided_digest, computed_digest):
+    if hmac.compare_digest(provided_digest_bytes, computed_digest):
         logfire.info("signature verification succeeded")
         return True
     else:
@@ -128,22 +155,9 @@ async def verify_open_phone_signature(request: Request):
 
 def extract_event_data(payload: OpenPhoneWebhookPayload) -> dict:
     """Extract relevant fields from the event data based on event type"""
-    # Convert the payload to dict first
-    payload_dict = payload.model_dump()
-
-    # Convert any datetime objects to ISO format strings in the payload_dict
-    def convert_datetime_to_str(obj):
-        if isinstance(obj, dict):
-            return {k: convert_datetime_to_str(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_datetime_to_str(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        else:
-            return obj
-
-    # Apply the conversion to the entire payload dict
-    payload_dict = convert_datetime_to_str(payload_dict)
+    # JSON mode has pydantic-core serialize datetimes to ISO strings in the same
+    # pass, so the dict is ready for the JSON column without a Python re-walk.
+    payload_dict = payload.model_dump(mode="json")
 
     event_data = {
         "event_type": payload.type,
@@ -181,8 +195,13 @@ async def webhook(
     payload: OpenPhoneWebhookPayload, background_tasks: BackgroundTasks, session: DBSession
 ):
     try:
-        # Extract event data
-        logfire.info(f"OpenPhone webhook received. type={payload.type} event_id={payload.id} ")
+        # Extract event data. Hot-path logs use logfire templates: the message is
+        # rendered by logfire and the values land as queryable span attributes.
+        logfire.info(
+            "OpenPhone webhook received. type={event_type} event_id={event_id}",
+            event_type=payload.type,
+            event_id=payload.id,
+        )
 
         event_data = extract_event_data(payload)
 
@@ -203,7 +222,8 @@ async def webhook(
                 logfire.info("Ignoring message from AI phone (circular trigger guard)")
             elif await contains_emoji(event_data["message_text"][:3]):
                 logfire.info(
-                    f"Ignoring message that starts with emoji: {event_data['message_text']}"
+                    "Ignoring message that starts with emoji: {message_text}",
+                    message_text=event_data["message_text"],
                 )
             else:
                 # Run analysis in the background
@@ -219,7 +239,9 @@ async def webhook(
             background_tasks.add_task(handle_ai_sms_event, event_data)
         else:
             logfire.info(
-                f"AI Assessment Skipped. to_number: {event_data.get('to_number', [])} payload_type: {payload.type}"
+                "AI Assessment Skipped. to_number: {to_number} payload_type: {event_type}",
+                to_number=event_data.get("to_number", []),
+                event_type=payload.type,
             )
 
         # check if event_id is already in the database
@@ -229,7 +251,8 @@ async def webhook(
         existing_event_record = result.scalar_one_or_none()
         if existing_event_record:
             logfire.info(
-                f"Event {event_data['event_id']} already processed (found existing DB record before commit attempt), skipping"
+                "Event {event_id} already processed (found existing DB record before commit attempt), skipping",
+                event_id=event_data["event_id"],
             )
             return {"message": "Event already processed"}
         else:
@@ -238,7 +261,9 @@ async def webhook(
             session.add(open_phone_event)
             await session.commit()
             await session.refresh(open_phone_event)
-            logfire.info(f"Successfully recorded OpenPhone event: {payload.type}")
+            logfire.info(
+                "Successfully recorded OpenPhone event: {event_type}", event_type=payload.type
+            )
             return {"message": "Event recorded successfully"}
 
     except IntegrityError as e:
@@ -297,7 +322,10 @@ async def route_get_contacts_by_external_ids(
     sources: list[str] | None = Query(default=None),
     page_token: str | None = None,
 ):
-    return await get_contacts_by_external_ids(external_ids, sources, page_token)
+    # OpenPhone already answers with JSON: pass its bytes through rather than
+    # parsing them into dicts only for FastAPI to encode them straight back.
+    response = await get_contacts_by_external_ids_response(external_ids, sources, page_token)
+    return Response(content=response.content, media_type="application/json")
 
 
 @router.delete("/contact/{id}")
@@ -309,100 +337,100 @@ async def route_delete_contact_by_id(
     if not is_valid:
         raise HTTPException(401, "Invalid password")
 
-    url = f"https://api.openphone.com/v1/contacts/{id}"
-    # User OpenPhone API to send a message
-    api_key = os.getenv("OPEN_PHONE_API_KEY")
-    headers = {
-        "Authorization": api_key,
-        "Content-Type": "application/json",
-    }
-    response = requests.delete(url, headers=headers)
+    async with _openphone_client() as client:
+        response = await client.delete(f"/v1/contacts/{id}")
     return response.status_code
 
 
 # Working!
 @router.post("/create_contacts_in_openphone", dependencies=[Depends(verify_admin_or_serniacapital)])
 async def create_contacts_in_openphone(overwrite=False, source_name=None):
+    # One async client for the whole run: blocking requests calls would stall the
+    # event loop for every round trip, and this route makes several per contact.
+    async with _openphone_client() as client:
+        custom_field_key_to_name = await get_custom_field_key_to_name(client)
 
-    headers = {
-        "Authorization": os.getenv("OPEN_PHONE_API_KEY"),
-        "Content-Type": "application/json",
-    }
+        contacts = get_contacts_sheet_as_json()
+        contact = contacts[35]
 
-    url = "https://api.openphone.com/v1/contact-custom-fields"
-    headers = {
-        "Authorization": f"{os.getenv('OPEN_PHONE_API_KEY')}",
-        "Content-Type": "application/json",
-    }
-    custom_fields_raw = requests.get(url, headers=headers).json()["data"]
-
-    custom_field_key_to_name = {field["key"]: field["name"] for field in custom_fields_raw}
-
-    contacts = get_contacts_sheet_as_json()
-    contact = contacts[35]
-
-    response_codes = []
-    responses = []
-
-    # The source name needs a timestamp, otherwise API will return 500 error on re-creation
-    if not source_name:
-        source_name = f"API-Emilio-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-
-    for contact in contacts:
-        print(contact["external_id"])
-
-        contact["Lease Start Date"] = contact["Lease Start Date"][:10] + "T00:00:00.000Z"
-        contact["Lease End Date"] = contact["Lease End Date"][:10] + "T00:00:00.000Z"
-
-        data = {
-            "defaultFields": {
-                "company": contact["Company"],
-                "emails": [{"name": " Email", "value": contact["Email"]}],
-                "firstName": contact["First Name"],
-                "lastName": contact["Last Name"],
-                "phoneNumbers": [{"name": "Phone", "value": contact["Phone Number"]}],
-                "role": contact["Role"],
-            },
-            "createdByUserId": "USXAiFJxgv",  # Emilio
-            "source": source_name,
-            "externalId": contact[
-                "external_id"
-            ],  # "e" + contact["Phone Number"],   # contact["external_id"]
-            "customFields": [
-                {"key": key, "value": contact[field_name]}
-                for key, field_name in custom_field_key_to_name.items()
-            ],
-        }
-        # pprint(data)
+        response_codes = []
+        responses = []
 
-        # get contact by external id
-        existing_contacts = await get_contacts_by_external_ids(
-            external_ids=[contact["external_id"]]
-        )
-        skip = False
-        if len(existing_contacts["data"]) > 0:
-            if overwrite:
-                print("Contact already exists, deleting...")
-                # delete contact(s)
-                for existing_contact in existing_contacts["data"]:
-                    url = f"https://api.openphone.com/v1/contacts/{existing_contact['id']}"
-                    response = requests.delete(url, headers=headers)
-                    pprint(response)
-            else:
-                print("Contact already exists, skipping...")
-                skip = True
+        # The source name needs a timestamp, otherwise API will return 500 error on re-creation
+        if not source_name:
+            source_name = f"API-Emilio-{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-        if not skip:
-            time.sleep(1)
-            response = requests.post(
-                "https://api.openphone.com/v1/contacts", headers=headers, json=data
-            )
-            response_codes.append(response.status_code)
-            pprint(response.json())
-            pprint(response.status_code)
-            responses.append(response.json())
+        # Look up every row's existing contacts up front in batched externalIds
+        # queries, rather than one GET per sheet row inside the loop.
+        existing_by_external_id = await get_contacts_grouped_by_external_id(
+            [contact["external_id"] for contact in contacts], client=client
+        )
 
-    assert set(response_codes) == set([201]) or response_codes == []
+        for contact in contacts:
+            contact["Lease Start Date"] = contact["Lease Start Date"][:10] + "T00:00:00.000Z"
+            contact["Lease End Date"] = contact["Lease End Date"][:10] + "T00:00:00.000Z"
+
+            data = {
+                "defaultFields": {
+                    "company": contact["Company"],
+                    "emails": [{"name": " Email", "value": contact["Email"]}],
+                    "firstName": contact["First Name"],
+                    "lastName": contact["Last Name"],
+                    "phoneNumbers": [{"name": "Phone", "value": contact["Phone Number"]}],
+                    "role": contact["Role"],
+                },
+                "createdByUserId": "USXAiFJxgv",  # Emilio
+                "source": source_name,
+                "externalId": contact[
+                    "external_id"
+                ],  # "e" + contact["Phone Number"],   # contact["external_id"]
+                "customFields": [
+                    {"key": key, "value": contact[field_name]}
+                    for key, field_name in custom_field_key_to_name.items()
+                ],
+            }
+
+            existing_contacts = existing_by_external_id.get(contact["external_id"], [])
+            skip = False
+            if len(existing_contacts) > 0:
+                if overwrite:
+                    logfire.info(
+                        "OpenPhone contact {external_id} already exists, deleting",
+                        external_id=contact["external_id"],
+                    )
+                    # delete contact(s)
+                    for existing_contact in existing_contacts:
+                        await client.delete(f"/v1/contacts/{existing_contact['id']}")
+                else:
+                    logfire.info(
+                        "OpenPhone contact {external_id} already exists, skipping",
+                        external_id=contact["external_id"],
+                    )
+                    skip = True
+
+            if not skip:
+                # No manual pause: the client's transport paces every OpenPhone
+                # request through the shared token bucket (see rate_limit.py).
+                response = await client.post("/v1/contacts", json=data)
+                response_json = response.json()
+                response_codes.append(response.status_code)
+                responses.append(response_json)
+                if response.status_code == 201:
+                    logfire.info(
+                        "Created OpenPhone contact {external_id}",
+                        external_id=contact["external_id"],
+                    )
+                    # A later sheet row with the same external_id must see this one.
+                    existing_by_external_id[contact["external_id"]] = [response_json["data"]]
+                else:
+                    logfire.error(
+                        "Failed to create OpenPhone contact {external_id}: {status_code}",
+                        external_id=contact["external_id"],
+                        status_code=response.status_code,
+                        response_body=response_json,
+                    )
+
+        assert set(response_codes) == set([201]) or response_codes == []
 
 
 @router.get("/tenants", dependencies=[Depends(verify_serniacapital_user)])
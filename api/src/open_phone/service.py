@@ -8,7 +8,6 @@ from typing import Any
 
 import httpx
 import logfire
-import requests
 from fastapi import HTTPException
 from sqlalchemy import select
 
@@ -152,12 +151,6 @@ async def upsert_openphone_contact(contact_create: ContactCreate):
     Returns:
         dict: The response from the OpenPhone API after the upsert operation.
     """
-    api_key = os.getenv("OPEN_PHONE_API_KEY")
-    headers = {
-        "Authorization": api_key,
-        "Content-Type": "application/json",
-    }
-
     async with AsyncSessionFactory() as db:
         # first, check if the contact already exists in our database
         # first check via slug if it exists
@@ -197,43 +190,42 @@ async def upsert_openphone_contact(contact_create: ContactCreate):
             ],  # "e" + contact["Phone Number"],   # contact["external_id"]
         }
 
-        # Check if contact already exists in OpenPhone before creating
+        # Check if contact already exists in OpenPhone before creating. The
+        # lookup and the write share one client, so the write reuses the
+        # lookup's connection instead of doing a second TLS handshake.
         external_id = data["externalId"]
-        lookup_response = requests.get(
-            "https://api.openphone.com/v1/contacts",
-            headers=headers,
-            params={"externalIds": [external_id]},
-        )
-        lookup_results = lookup_response.json().get("data", [])
-
-        if lookup_results:
-            # Contact exists — update it
-            if len(lookup_results) > 1:
-                logfire.warn(f"Multiple contacts found for the same externalId: {external_id}")
-            contact.openphone_contact_id = lookup_results[0]["id"]
-            patch_response = requests.patch(
-                f"https://api.openphone.com/v1/contacts/{contact.openphone_contact_id}",
-                headers=headers,
-                json=data,
-            )
-            contact.openphone_json = patch_response.json()["data"]
-            if patch_response.status_code == 200:
-                final_response = patch_response
-            else:
-                logfire.error(f"Failed to patch contact: {patch_response.json()}")
-                final_response = patch_response
-        else:
-            # Contact doesn't exist — create it
-            response = requests.post(
-                "https://api.openphone.com/v1/contacts", headers=headers, json=data
+        async with _openphone_client() as client:
+            lookup_response = await client.get(
+                "/v1/contacts", params={"externalIds": [external_id]}
             )
-            if response.status_code == 201:
-                contact.openphone_contact_id = response.json()["data"]["id"]
-                contact.openphone_json = response.json()["data"]
-                final_response = response
+            lookup_results = lookup_response.json().get("data", [])
+
+            if lookup_results:
+                # Contact exists — update it
+                if len(lookup_results) > 1:
+                    logfire.warn(f"Multiple contacts found for the same externalId: {external_id}")
+                contact.openphone_contact_id = lookup_results[0]["id"]
+                patch_response = await client.patch(
+                    f"/v1/contacts/{contact.openphone_contact_id}", json=data
+                )
+                contact.openphone_json = patch_response.json()["data"]
+                if patch_response.status_code == 200:
+                    final_response = patch_response
+                else:
+                    logfire.error(f"Failed to patch contact: {patch_response.json()}")
+                    final_response = patch_response
             else:
-                logfire.error(f"Failed to create contact: {response.status_code} {response.json()}")
-                final_response = response
+                # Contact doesn't exist — create it
+                response = await client.post("/v1/contacts", json=data)
+                if response.status_code == 201:
+                    contact.openphone_contact_id = response.json()["data"]["id"]
+                    contact.openphone_json = response.json()["data"]
+                    final_response = response
+                else:
+                    logfire.error(
+                        f"Failed to create contact: {response.status_code} {response.json()}"
+                    )
+                    final_response = response
 
         # Use merge instead of upsert
         merged_contact = await db.merge(contact)
@@ -243,16 +235,65 @@ async def upsert_openphone_contact(contact_create: ContactCreate):
     return final_response
 
 
+# Page size for externalIds lookups; also the batch size for bulk lookups.
+_EXTERNAL_IDS_PAGE_SIZE = 49
+
+
 async def get_contacts_by_external_ids(
     external_ids: list[str],
     sources: list[str] | None = None,
     page_token: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ):
     """Internal function version without Query dependencies"""
-    max_results = 49
+    response = await get_contacts_by_external_ids_response(
+        external_ids, sources, page_token, client=client
+    )
+    return response.json()
+
+
+async def get_contacts_grouped_by_external_id(
+    external_ids: list[str], client: httpx.AsyncClient | None = None
+) -> dict[str, list[dict]]:
+    """Existing OpenPhone contacts for many externalIds, keyed by externalId.
+
+    Looks the ids up in batches of the lookup's page size (following
+    ``nextPageToken`` when one id has several contacts) instead of one request
+    per id. Ids with no contact are absent from the result.
+
+    If *client* is None, one temporary client is created for all the lookups.
+    """
+    if client is None:
+        async with _openphone_client() as c:
+            return await get_contacts_grouped_by_external_id(external_ids, client=c)
+
+    grouped: dict[str, list[dict]] = {}
+    for start in range(0, len(external_ids), _EXTERNAL_IDS_PAGE_SIZE):
+        batch = external_ids[start : start + _EXTERNAL_IDS_PAGE_SIZE]
+        page_token: str | None = None
+        while True:
+            page = await get_contacts_by_external_ids(batch, page_token=page_token, client=client)
+            for contact in page.get("data", []):
+                grouped.setdefault(contact.get("externalId"), []).append(contact)
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+    return grouped
 
+
+async def get_contacts_by_external_ids_response(
+    external_ids: list[str],
+    sources: list[str] | None = None,
+    page_token: str | None = None,
+    client: httpx.AsyncClient | None = None,
+) -> httpx.Response:
+    """Raw OpenPhone response for an externalIds lookup, for callers that can pass the
+    upstream JSON bytes straight through instead of parsing them.
+
+    If *client* is None, a temporary client is created for the request.
+    """
     # Build query parameters
-    params = {"externalIds": external_ids, "maxResults": max_results}
+    params = {"externalIds": external_ids, "maxResults": _EXTERNAL_IDS_PAGE_SIZE}
 
     if sources:
         params["sources"] = sources
@@ -263,19 +304,44 @@ async def get_contacts_by_external_ids(
     if not api_key:
         raise HTTPException(status_code=500, detail="OpenPhone API key not configured")
 
-    headers = {"Authorization": api_key, "Content-Type": "application/json"}
-
     try:
-        response = requests.get(
-            "https://api.openphone.com/v1/contacts", headers=headers, params=params
-        )
+        if client is not None:
+            response = await client.get("/v1/contacts", params=params)
+        else:
+            async with _openphone_client() as c:
+                response = await c.get("/v1/contacts", params=params)
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return response
+    except httpx.HTTPError as e:
         logfire.error(f"Error fetching contacts: {str(e)}")
         raise
 
 
+_custom_fields_cache: dict[str, Any] = {"data": None, "ts": 0.0}
+_CUSTOM_FIELDS_CACHE_TTL = 300  # 5 minutes
+
+
+async def get_custom_field_key_to_name(client: httpx.AsyncClient) -> dict[str, str]:
+    """Map OpenPhone contact custom-field keys to their display names.
+
+    The field definitions rarely change, so they are fetched at most once per TTL
+    window rather than on every bulk contact run.
+    """
+    now = time.time()
+    if (
+        _custom_fields_cache["data"] is not None
+        and (now - _custom_fields_cache["ts"]) < _CUSTOM_FIELDS_CACHE_TTL
+    ):
+        return _custom_fields_cache["data"]
+
+    resp = await client.get("/v1/contact-custom-fields")
+    resp.raise_for_status()
+    data = {field["key"]: field["name"] for field in resp.json()["data"]}
+    _custom_fields_cache["data"] = data
+    _custom_fields_cache["ts"] = now
+    return data
+
+
 _contacts_sheet_cache: dict[str, Any] = {"data": None, "ts": 0.0}
 _CONTACTS_SHEET_CACHE_TTL = 300  # 5 minutes
 
@@ -0,0 +1,66 @@
+"""Unit tests for the chat_emilio agent's page fetching."""
+
+import httpx
+import pytest
+from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+from pydantic_ai.models.test import TestModel
+
+from api.src.ai_demos.chat_emilio import agent as chat_emilio_agent
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_reuses_cached_page(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, text="resume text")
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        chat_emilio_agent.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(chat_emilio_agent, "_page_cache", {})
+
+    url = "https://resume.example.com/"
+    assert await chat_emilio_agent._fetch_url(url) == "resume text"
+    assert await chat_emilio_agent._fetch_url(url) == "resume text"
+    assert calls == [url]
+
+
+@pytest.fixture
+def fake_resume(monkeypatch):
+    async def fake_fetch_url(url: str) -> str:
+        assert url == chat_emilio_agent.RESUME_URL
+        return "RESUME BODY"
+
+    monkeypatch.setattr(chat_emilio_agent, "_fetch_url", fake_fetch_url)
+
+
+def _last_request_instructions(result) -> str:
+    requests = [m for m in result.all_messages() if isinstance(m, ModelRequest)]
+    return requests[-1].instructions or ""
+
+
+@pytest.mark.asyncio
+async def test_resume_is_inlined_into_instructions(fake_resume):
+    with chat_emilio_agent.agent.override(model=TestModel(call_tools=[])):
+        result = await chat_emilio_agent.agent.run("Who is Emilio?")
+
+    assert "RESUME BODY" in _last_request_instructions(result)
+
+
+@pytest.mark.asyncio
+async def test_resume_is_inlined_on_follow_up_turns(fake_resume):
+    # The chat UI replays history without system-prompt parts, so the resume
+    # must still reach the model when message_history is non-empty.
+    history = [
+        ModelRequest(parts=[UserPromptPart(content="Who is Emilio?")]),
+        ModelResponse(parts=[TextPart(content="Emilio is a developer.")]),
+    ]
+    with chat_emilio_agent.agent.override(model=TestModel(call_tools=[])):
+        result = await chat_emilio_agent.agent.run("Where did he work?", message_history=history)
+
+    assert "RESUME BODY" in _last_request_instructions(result)
@@ -0,0 +1,66 @@
+"""Unit tests for the chat_weather agent's weather tool."""
+
+import httpx
+import pytest
+
+from api.src.ai_demos.chat_weather import agent as chat_weather_agent
+
+
+@pytest.mark.asyncio
+async def test_get_current_weather_caches_nearby_points(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["latitude"])
+        return httpx.Response(200, json={"current": {"temperature_2m": 21.5}})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        chat_weather_agent.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    monkeypatch.setattr(chat_weather_agent, "_weather_cache", {})
+
+    first = await chat_weather_agent.get_current_weather(None, 40.71281, -74.00601)
+    second = await chat_weather_agent.get_current_weather(None, 40.71279, -74.00599)
+
+    assert first == second == {"current": {"temperature_2m": 21.5}}
+    assert calls == ["40.71"]
+
+
+@pytest.mark.asyncio
+async def test_get_current_weather_returns_error_on_http_failure(monkeypatch):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        chat_weather_agent.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)), **kwargs
+        ),
+    )
+    monkeypatch.setattr(chat_weather_agent, "_weather_cache", {})
+
+    result = await chat_weather_agent.get_current_weather(None, 1.0, 2.0)
+
+    assert "error" in result
+    assert chat_weather_agent._weather_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_get_current_weather_returns_error_on_non_json_body(monkeypatch):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        chat_weather_agent.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text="<html>")),
+            **kwargs,
+        ),
+    )
+    monkeypatch.setattr(chat_weather_agent, "_weather_cache", {})
+
+    result = await chat_weather_agent.get_current_weather(None, 1.0, 2.0)
+
+    assert "error" in result
+    assert chat_weather_agent._weather_cache == {}
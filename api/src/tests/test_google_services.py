@@ -15,6 +15,7 @@ marked ``live`` and only run when explicitly requested:
 import datetime
 import os
 from pprint import pprint
+from unittest.mock import patch
 
 import logfire
 import pytest
@@ -30,6 +31,7 @@ from api.src.google.calendar.service import (
     get_calendar_service,
 )
 from api.src.google.common.service_account_auth import (
+    _cached_delegated_credentials,
     get_delegated_credentials,
     get_service_credentials,
 )
@@ -126,6 +128,21 @@ def test_get_service_credentials():
     print(creds)
 
 
+def test_get_delegated_credentials_is_cached_per_user_and_scopes():
+    """Repeat calls reuse one credentials object (and so its access token)."""
+    _cached_delegated_credentials.cache_clear()
+    with patch(
+        "api.src.google.common.service_account_auth.get_service_credentials"
+    ) as mock_service_credentials:
+        mock_service_credentials.return_value.with_subject.side_effect = lambda email: object()
+        first = get_delegated_credentials("a@example.com", ["scope-1"])
+        assert get_delegated_credentials("a@example.com", ["scope-1"]) is first
+        assert get_delegated_credentials("b@example.com", ["scope-1"]) is not first
+        assert get_delegated_credentials("a@example.com", ["scope-2"]) is not first
+        assert mock_service_credentials.call_count == 3
+    _cached_delegated_credentials.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Gmail routes (from api/src/google/gmail/tests.py)
 # ---------------------------------------------------------------------------
@@ -12,6 +12,7 @@ Live tests hit real third-party APIs and only run when explicitly requested:
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 import pytz
@@ -22,7 +23,11 @@ load_dotenv(find_dotenv(".env"), override=False)
 from api.src.contact.service import ContactCreate
 from api.src.open_phone.escalate import analyze_for_twilio_escalation
 from api.src.open_phone.routes import contains_emoji
-from api.src.open_phone.service import send_message, upsert_openphone_contact
+from api.src.open_phone.service import (
+    get_contacts_grouped_by_external_id,
+    send_message,
+    upsert_openphone_contact,
+)
 
 # ---------------------------------------------------------------------------
 # Escalation tests (from api/src/open_phone/escalate.py)
@@ -112,6 +117,37 @@ async def test_upsert_openphone_contact():
     assert response.status_code == 201 or response.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_grouped_by_external_id_batches_lookups():
+    """60 ids take two batched lookups (49 + 11), following nextPageToken within a batch."""
+    external_ids = [f"ext{i}" for i in range(60)]
+    pages = {
+        (tuple(external_ids[:49]), None): {
+            "data": [{"id": "CT0", "externalId": "ext0"}],
+            "nextPageToken": "p2",
+        },
+        (tuple(external_ids[:49]), "p2"): {"data": [{"id": "CT0b", "externalId": "ext0"}]},
+        (tuple(external_ids[49:]), None): {"data": [{"id": "CT59", "externalId": "ext59"}]},
+    }
+    calls = []
+    clients = set()
+    client = object()
+
+    async def fake_lookup(batch, page_token=None, client=None):
+        calls.append((tuple(batch), page_token))
+        clients.add(client)
+        return pages[(tuple(batch), page_token)]
+
+    with patch("api.src.open_phone.service.get_contacts_by_external_ids", side_effect=fake_lookup):
+        grouped = await get_contacts_grouped_by_external_id(external_ids, client=client)
+
+    assert calls == list(pages)
+    assert clients == {client}  # every batch and page reuses the caller's client
+    assert [c["id"] for c in grouped["ext0"]] == ["CT0", "CT0b"]
+    assert [c["id"] for c in grouped["ext59"]] == ["CT59"]
+    assert "ext1" not in grouped
+
+
 @pytest.mark.live
 @pytest.mark.asyncio
 async def test_send_message():
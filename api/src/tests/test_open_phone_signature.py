@@ -0,0 +1,81 @@
+"""Unit tests for the OpenPhone webhook signature check."""
+
+import base64
+import hashlib
+import hmac
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from api.src.open_phone.routes import verify_open_phone_signature
+
+SIGNING_KEY = b"test-openphone-signing-key"
+BODY = b'{"id": "EV123", "type": "message.received"}'
+TIMESTAMP = "1700000000000"
+
+
+@pytest.fixture(autouse=True)
+def signing_secret(monkeypatch):
+    monkeypatch.setenv("OPEN_PHONE_WEBHOOK_SECRET", base64.b64encode(SIGNING_KEY).decode())
+
+
+def _signature(body: bytes = BODY, key: bytes = SIGNING_KEY) -> str:
+    digest = hmac.new(key, TIMESTAMP.encode() + b"." + body, hashlib.sha256).digest()
+    return f"hmac;1;{TIMESTAMP};{base64.b64encode(digest).decode()}"
+
+
+def _request(signature: str, body: bytes = BODY) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/open_phone/webhook",
+        "headers": [(b"openphone-signature", signature.encode())],
+    }
+    return Request(scope, receive)
+
+
+@pytest.mark.asyncio
+async def test_valid_signature_passes():
+    assert await verify_open_phone_signature(_request(_signature())) is True
+
+
+@pytest.mark.asyncio
+async def test_tampered_body_is_rejected():
+    request = _request(_signature(), body=BODY.replace(b"EV123", b"EV999"))
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_open_phone_signature(request)
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_wrong_key_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_open_phone_signature(_request(_signature(key=b"some-other-key")))
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_non_base64_digest_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_open_phone_signature(_request(f"hmac;1;{TIMESTAMP};not*base64!"))
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_wrong_length_digest_is_rejected():
+    short_digest = base64.b64encode(b"\x00" * 20).decode()
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_open_phone_signature(_request(f"hmac;1;{TIMESTAMP};{short_digest}"))
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("header", ["", "hmac;1;1700000000000", "sha1;1;1700000000000;abc="])
+async def test_malformed_signature_header_is_rejected(header):
+    with pytest.raises(HTTPException) as exc_info:
+        await verify_open_phone_signature(_request(header))
+    assert exc_info.value.status_code == 403
@@ -418,6 +418,35 @@ async def test_send_message_uses_generous_timeout():
     assert seen["timeout"].read is not None and seen["timeout"].read > 5
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_by_external_ids_uses_rate_limited_client(monkeypatch):
+    """The externalIds lookup goes through the rate-limited OpenPhone client, so a
+    residual 429 is retried instead of surfacing to the caller."""
+    from api.src.open_phone import service
+
+    monkeypatch.setenv("OPEN_PHONE_API_KEY", "test-key")
+    calls = {"n": 0}
+    seen: dict = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        seen["url"] = request.url
+        if calls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"data": [{"id": "CT1"}]})
+
+    transport = RateLimitedTransport(inner=httpx.MockTransport(handler))
+    client = httpx.AsyncClient(transport=transport, base_url="https://api.openphone.com")
+
+    with mock.patch.object(service, "_openphone_client", return_value=client):
+        result = await service.get_contacts_by_external_ids(["ext1", "ext2"])
+
+    assert result == {"data": [{"id": "CT1"}]}
+    assert calls["n"] == 2  # one 429 + one success
+    assert seen["url"].path == "/v1/contacts"
+    assert seen["url"].params.get_list("externalIds") == ["ext1", "ext2"]
+
+
 @pytest.mark.asyncio
 async def test_token_bucket_throttles_burst():
     """With capacity exhausted, the next acquire waits ~1/rate seconds."""
@@ -6,6 +6,10 @@ from fastapi import HTTPException, Request, status
 from api.src.utils.clerk import verify_serniacapital_user
 from api.src.utils.password import verify_admin_auth
 
+# Read once at import: api/__init__.py has already loaded .env by now, and the
+# secret only changes with a redeploy.
+_CRON_BEARER = f"Bearer {os.environ.get('CRON_SECRET')}"
+
 
 async def verify_cron_secret(request: Request):
     """
@@ -13,7 +17,7 @@ async def verify_cron_secret(request: Request):
     Raises 401 if unauthorized.
     """
     auth_header = request.headers.get("authorization")
-    if not auth_header or auth_header != f"Bearer {os.environ.get('CRON_SECRET')}":
+    if not auth_header or auth_header != _CRON_BEARER:
         raise HTTPException(status_code=401, detail="Unauthorized")
     return True
 
@@ -43,6 +43,9 @@ class _RuleBasedLoggingHandler(LogfireLoggingHandler):
 
 def _load_local_env_if_possible() -> None:
     # Load local development variables (does not impact preview/production)
+    if os.environ.get("RAILWAY_ENVIRONMENT_NAME"):
+        # Hosted: real env vars are injected and there is no .env to find.
+        return
     try:
         load_dotenv(find_dotenv(".env"), override=True)
     except PermissionError:
@@ -1,15 +1,19 @@
 from dotenv import find_dotenv, load_dotenv
 
 load_dotenv(find_dotenv(".env"))
+import hashlib
 import hmac
 import json
 import os
 
 from fastapi import HTTPException, Request
 
+# Read once at import (after the load_dotenv above); they only change with a redeploy.
+_ADMIN_PASSWORD_SALT = os.getenv("ADMIN_PASSWORD_SALT")
+_ADMIN_PASSWORD_HASH = os.getenv("ADMIN_PASSWORD_HASH")
+
 
 def adhoc_generate_new_password():
-    import hashlib
     import secrets
 
     # Generate a random salt
@@ -27,9 +31,7 @@ def adhoc_generate_new_password():
 
 def hash_password(password: str) -> str:
     """Hash a plaintext password using the salt from environment variables."""
-    import hashlib
-
-    salt = os.getenv("ADMIN_PASSWORD_SALT")
+    salt = _ADMIN_PASSWORD_SALT
     if not salt:
         raise HTTPException(500, "Password salt not configured")
 
@@ -40,7 +42,7 @@ def hash_password(password: str) -> str:
 
 async def verify_admin_password(password_attempt: str) -> bool:
     password_attempt_hash = hash_password(password_attempt)
-    correct_hash = os.getenv("ADMIN_PASSWORD_HASH")
+    correct_hash = _ADMIN_PASSWORD_HASH
 
     if not correct_hash:
         raise HTTPException(500, "Password hash not configured")
@@ -34,19 +34,16 @@ from sernia_mcp.server import mcp
 class _RequestLogMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         start = time.monotonic()
-        with logfire.span(
-            "{method} {path}",
-            method=request.method,
-            path=request.url.path,
-        ) as span:
+        # Read straight from the ASGI scope: `request.url` scans the headers for
+        # Host and builds/parses a full URL just to hand back the path, and this
+        # middleware wraps every MCP request.
+        method = request.scope["method"]
+        path = request.scope["path"]
+        with logfire.span("{method} {path}", method=method, path=path) as span:
             try:
                 response = await call_next(request)
             except Exception:
-                logfire.exception(
-                    "unhandled exception in request",
-                    method=request.method,
-                    path=request.url.path,
-                )
+                logfire.exception("unhandled exception in request", method=method, path=path)
                 raise
             span.set_attribute("http.status_code", response.status_code)
             span.set_attribute("duration_ms", int((time.monotonic() - start) * 1000))
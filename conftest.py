@@ -29,7 +29,7 @@ os.environ.setdefault("PROD_CLERK_WEBHOOK_SECRET", "test-clerk-webhook")
 os.environ.setdefault("TWILIO_ACCOUNT_SID", "test-twilio-sid")
 os.environ.setdefault("TWILIO_AUTH_TOKEN", "test-twilio-token")
 os.environ.setdefault("CLICKUP_API_KEY", "test-clickup-key")
-# api/index.py's startup check (required_env_vars) — needed because the test
+# api/index.py's startup check (REQUIRED_ENV_VARS) — needed because the test
 # conftest imports `app`.
 os.environ.setdefault("SESSION_SECRET_KEY", "test-session-secret")
 os.environ.setdefault("GOOGLE_OAUTH_CLIENT_ID", "test-google-client-id")